@@ -0,0 +1,88 @@
+"""Shared setup for the benchmark plotting driver (plot_all.py)."""
+
+import matplotlib
+# Use a non-interactive backend if no display available
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+from collections import defaultdict
+from itertools import combinations
+from pathlib import Path
+import sys
+
+# Path setup
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+RESULTS_DIR = PROJECT_ROOT / 'results'
+PLOTS_DIR = PROJECT_ROOT / 'plots'
+
+
+def load_csv(path, schema, run_hint):
+    """Read a benchmark CSV into a structured array (one C-level parse, no per-row dicts)."""
+    if not path.exists():
+        print(f"Error: {path} not found")
+        print(f"Please run: {run_hint}")
+        sys.exit(1)
+    return np.genfromtxt(path, delimiter=',', names=True, encoding='utf-8',
+                         ndmin=1, dtype=schema)
+
+
+class Dataset:
+    """Benchmark rows pre-bucketed once by every combination of filter columns,
+    so each get_data() call is a dict lookup instead of a scan over all rows."""
+
+    def __init__(self, data, filter_keys):
+        self.data = data
+        self.filter_keys = tuple(filter_keys)
+        self._buckets = {keys: self._bucket_by(keys)
+                         for r in range(1, len(self.filter_keys) + 1)
+                         for keys in combinations(self.filter_keys, r)}
+
+    def _bucket_by(self, keys):
+        buckets = defaultdict(list)
+        for i, values in enumerate(zip(*(self.data[key].tolist() for key in keys))):
+            buckets[values].append(i)
+        return {values: self.data[rows] for values, rows in buckets.items()}
+
+    def get_data(self, **filters):
+        unknown = set(filters) - set(self.filter_keys)
+        if unknown:
+            raise TypeError(f"get_data() got unexpected filter(s): {', '.join(sorted(unknown))} "
+                            f"(expected any of {', '.join(self.filter_keys)})")
+        # None or an empty string means "don't filter on this column"
+        filters = {key: value for key, value in filters.items() if value is not None and value != ''}
+        keys = tuple(key for key in self.filter_keys if key in filters)
+        if not keys:
+            return self.data
+        return self._buckets[keys].get(tuple(filters[key] for key in keys), self.data[:0])
+
+    def get_unique(self, key, **filters):
+        return np.unique(self.get_data(**filters)[key]).tolist()
+
+
+def configure_rcparams():
+    plt.rcParams['figure.figsize'] = (12, 7)
+    plt.rcParams['font.size'] = 11
+    plt.rcParams['lines.linewidth'] = 2
+    plt.rcParams['axes.grid'] = True
+    plt.rcParams['grid.alpha'] = 0.3
+    plt.rcParams['figure.autolayout'] = False
+
+
+def create_figure():
+    """Create the single Figure/Axes shared by every graph.
+
+    Each graph starts from ax.clear(). The layout is static, so margins are
+    fixed once instead of running tight_layout/bbox_inches='tight' on every save.
+    """
+    fig, ax = plt.subplots(figsize=(12, 7))
+    fig.subplots_adjust(left=0.08, right=0.97, top=0.90, bottom=0.1)
+    return fig, ax
+
+
+def save_both(fig, name):
+    """Save a PNG preview (dpi=150) and a vector PDF (dpi-independent)."""
+    fig.savefig(PLOTS_DIR / f'{name}.png', dpi=150)
+    fig.savefig(PLOTS_DIR / f'{name}.pdf')
+    print(f"  Saved: {PLOTS_DIR / f'{name}.png'}\n")
@@ -20,10 +20,14 @@ echo ""
 echo "[2/3] Running benchmark..."
 "$SCRIPT_DIR/run_thread_scaling.sh"
 
-# Step 3: Generate plots
+# Step 3: Generate plots (skipped when run_all_benchmarks.sh plots everything at once)
 echo ""
-echo "[3/3] Generating plots..."
-python3 "$SCRIPT_DIR/plot_thread_scaling.py"
+if [ -n "$SKIP_PLOTS" ]; then
+    echo "[3/3] Skipping plots (SKIP_PLOTS set)"
+else
+    echo "[3/3] Generating plots..."
+    python3 "$SCRIPT_DIR/plot_all.py" scaling
+fi
 
 echo ""
 echo "========================================="
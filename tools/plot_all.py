@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""Generate all benchmark plots in a single interpreter.
+
+Usage: plot_all.py [breakdown] [scaling]   (default: both)
+"""
+
+import argparse
+import matplotlib.pyplot as plt
+import numpy as np
+
+from _plot_common import (Dataset, PLOTS_DIR, RESULTS_DIR, configure_rcparams,
+                          create_figure, load_csv, save_both)
+
+BREAKDOWN_FILE = RESULTS_DIR / 'parallel_breakdown.csv'
+BREAKDOWN_SCHEMA = [('n', 'i8'),
+                    ('threads', 'i4'),
+                    ('build_furthest_ms', 'f8'),
+                    ('sample_intervals_ms', 'f8'),
+                    ('build_connections_ms', 'f8'),
+                    ('scan_samples_ms', 'f8'),
+                    ('scan_nonsample_ms', 'f8'),
+                    ('total_ms', 'f8')]
+
+SCALING_FILE = RESULTS_DIR / 'thread_scaling.csv'
+SCALING_SCHEMA = [('algorithm', 'U16'),
+                  ('n', 'i8'),
+                  ('threads', 'i4'),
+                  ('time_ms', 'f8'),
+                  ('num_selected', 'i8'),
+                  ('throughput_M_per_sec', 'f8')]
+
+# Phase columns in execution order, with their plot labels and colors
+PHASE_KEYS = ['build_furthest_ms', 'sample_intervals_ms', 'build_connections_ms',
+              'scan_samples_ms', 'scan_nonsample_ms']
+PHASE_LABELS = ['BuildFurthest', 'SampleIntervals', 'BuildConnections',
+                'ScanSamples', 'ScanNonsample']
+PHASE_COLORS = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6']
+
+
+def render_breakdown(bdata, fig, ax):
+    sizes = bdata.get_unique('n')
+    thread_counts = bdata.get_unique('threads')
+
+    print("Generating breakdown visualizations...")
+    print(f"Input sizes: {sizes}")
+    print(f"Thread counts: {thread_counts}\n")
+
+    # ============================================================================
+    # Graph 1: Stacked Bar Chart - Time Breakdown by Thread Count (largest size)
+    # ============================================================================
+
+    # Automatically select the largest size from available data
+    n_focus = max(sizes)
+    print(f"Graph 1: Stacked Bar Chart - Phase Breakdown (n={n_focus:,})...")
+
+    ax.clear()
+
+    # Focus on largest size to see bottlenecks clearly
+    breakdown_data = np.sort(bdata.get_data(n=n_focus), order='threads')
+
+    threads = breakdown_data['threads']
+
+    # One row per phase; each row's bottom is the cumulative sum of the rows below it
+    stack = np.vstack([breakdown_data[key] for key in PHASE_KEYS])
+    bottoms = np.vstack([np.zeros(len(threads)), np.cumsum(stack[:-1], axis=0)])
+
+    x = np.arange(len(threads))
+    width = 0.6
+
+    for vals, bottom, label, color in zip(stack, bottoms, PHASE_LABELS, PHASE_COLORS):
+        ax.bar(x, vals, width, bottom=bottom, label=label, color=color)
+
+    ax.set_xlabel('Thread Count', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Time (ms)', fontsize=12, fontweight='bold')
+    ax.set_title(f'KernelParallelFast Phase Breakdown (n={n_focus:,})', fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(threads)
+    ax.legend(loc='upper right')
+    ax.grid(True, axis='y', alpha=0.3)
+
+    save_both(fig, 'breakdown_stacked')
+
+    # ============================================================================
+    # Graph 2: Line Graph - Each Phase Scaling with Thread Count (largest size)
+    # ============================================================================
+    print(f"Graph 2: Phase Scaling with Thread Count (n={n_focus:,})...")
+
+    ax.clear()
+
+    breakdown_data = np.sort(bdata.get_data(n=n_focus), order='threads')
+    threads = breakdown_data['threads']
+    build_furthest = breakdown_data['build_furthest_ms']
+    sample_intervals = breakdown_data['sample_intervals_ms']
+    build_connections = breakdown_data['build_connections_ms']
+    scan_samples = breakdown_data['scan_samples_ms']
+    scan_nonsample = breakdown_data['scan_nonsample_ms']
+
+    ax.plot(threads, build_furthest, marker='o', markersize=8, linewidth=2,
+            label='BuildFurthest', color='#3498db')
+    ax.plot(threads, sample_intervals, marker='s', markersize=8, linewidth=2,
+            label='SampleIntervals', color='#e74c3c')
+    ax.plot(threads, build_connections, marker='^', markersize=8, linewidth=2,
+            label='BuildConnections', color='#2ecc71')
+    ax.plot(threads, scan_samples, marker='d', markersize=8, linewidth=2,
+            label='ScanSamples', color='#f39c12')
+    ax.plot(threads, scan_nonsample, marker='*', markersize=10, linewidth=2,
+            label='ScanNonsample', color='#9b59b6')
+
+    ax.set_xlabel('Thread Count', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Time (ms)', fontsize=12, fontweight='bold')
+    ax.set_title(f'Phase Execution Time vs Thread Count (n={n_focus:,})', fontsize=14, fontweight='bold')
+    ax.legend(loc='upper right')
+    ax.grid(True, alpha=0.3)
+    ax.set_xticks(threads)
+
+    save_both(fig, 'breakdown_scaling')
+
+    # ============================================================================
+    # Graph 3: Percentage Breakdown (Normalized to 100%)
+    # ============================================================================
+    print(f"Graph 3: Percentage Breakdown by Thread Count (n={n_focus:,})...")
+
+    ax.clear()
+
+    breakdown_data = np.sort(bdata.get_data(n=n_focus), order='threads')
+    threads = breakdown_data['threads']
+
+    # Calculate percentages
+    stack_pct = np.vstack([breakdown_data[key] for key in PHASE_KEYS]) / breakdown_data['total_ms'] * 100
+    bottoms_pct = np.vstack([np.zeros(len(threads)), np.cumsum(stack_pct[:-1], axis=0)])
+
+    x = np.arange(len(threads))
+    width = 0.6
+
+    for vals, bottom, label, color in zip(stack_pct, bottoms_pct, PHASE_LABELS, PHASE_COLORS):
+        ax.bar(x, vals, width, bottom=bottom, label=label, color=color)
+
+    ax.set_xlabel('Thread Count', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Percentage of Total Time (%)', fontsize=12, fontweight='bold')
+    ax.set_title(f'Phase Percentage Breakdown (n={n_focus:,})', fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(threads)
+    ax.legend(loc='upper right')
+    ax.grid(True, axis='y', alpha=0.3)
+    ax.set_ylim([0, 100])
+
+    save_both(fig, 'breakdown_percentage')
+
+    # ============================================================================
+    # Graph 4: Speedup of Each Phase (relative to 1 thread)
+    # ============================================================================
+    print(f"Graph 4: Phase Speedup vs Thread Count (n={n_focus:,})...")
+
+    ax.clear()
+
+    breakdown_data = np.sort(bdata.get_data(n=n_focus), order='threads')
+    threads = breakdown_data['threads']
+
+    # Get 1-thread baseline
+    baseline = bdata.get_data(n=n_focus, threads=1)[0]
+    baseline_build_furthest = baseline['build_furthest_ms']
+    baseline_sample_intervals = baseline['sample_intervals_ms']
+    baseline_build_connections = baseline['build_connections_ms']
+    baseline_scan_samples = baseline['scan_samples_ms']
+    baseline_scan_nonsample = baseline['scan_nonsample_ms']
+
+    # Calculate speedups
+    build_furthest_speedup = baseline_build_furthest / breakdown_data['build_furthest_ms']
+    sample_intervals_speedup = baseline_sample_intervals / breakdown_data['sample_intervals_ms']
+    build_connections_speedup = baseline_build_connections / breakdown_data['build_connections_ms']
+    scan_samples_speedup = baseline_scan_samples / breakdown_data['scan_samples_ms']
+    scan_nonsample_speedup = baseline_scan_nonsample / breakdown_data['scan_nonsample_ms']
+
+    ax.plot(threads, build_furthest_speedup, marker='o', markersize=8, linewidth=2,
+            label='BuildFurthest', color='#3498db')
+    ax.plot(threads, sample_intervals_speedup, marker='s', markersize=8, linewidth=2,
+            label='SampleIntervals', color='#e74c3c')
+    ax.plot(threads, build_connections_speedup, marker='^', markersize=8, linewidth=2,
+            label='BuildConnections', color='#2ecc71')
+    ax.plot(threads, scan_samples_speedup, marker='d', markersize=8, linewidth=2,
+            label='ScanSamples', color='#f39c12')
+    ax.plot(threads, scan_nonsample_speedup, marker='*', markersize=10, linewidth=2,
+            label='ScanNonsample', color='#9b59b6')
+
+    # Ideal linear speedup
+    ax.plot(threads, threads, 'k:', linewidth=2, alpha=0.5, label='Ideal Linear')
+
+    ax.set_xlabel('Thread Count', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Speedup (vs 1 thread)', fontsize=12, fontweight='bold')
+    ax.set_title(f'Phase Speedup vs Thread Count (n={n_focus:,})', fontsize=14, fontweight='bold')
+    ax.legend(loc='upper left')
+    ax.grid(True, alpha=0.3)
+    ax.set_xticks(threads)
+
+    save_both(fig, 'breakdown_speedup')
+
+    # ============================================================================
+    # Summary Statistics
+    # ============================================================================
+    print("="*70)
+    print(f"BREAKDOWN ANALYSIS SUMMARY (n={n_focus:,})")
+    print("="*70)
+
+    breakdown_data = np.sort(bdata.get_data(n=n_focus), order='threads')
+    baseline = breakdown_data[0]
+
+    print(f"\nBaseline (1 thread):")
+    print(f"  Total: {baseline['total_ms']:.2f} ms")
+    print(f"    BuildFurthest:     {baseline['build_furthest_ms']:7.2f} ms ({baseline['build_furthest_ms']/baseline['total_ms']*100:5.1f}%)")
+    print(f"    SampleIntervals:   {baseline['sample_intervals_ms']:7.2f} ms ({baseline['sample_intervals_ms']/baseline['total_ms']*100:5.1f}%)")
+    print(f"    BuildConnections:  {baseline['build_connections_ms']:7.2f} ms ({baseline['build_connections_ms']/baseline['total_ms']*100:5.1f}%)")
+    print(f"    ScanSamples:       {baseline['scan_samples_ms']:7.2f} ms ({baseline['scan_samples_ms']/baseline['total_ms']*100:5.1f}%)")
+    print(f"    ScanNonsample:     {baseline['scan_nonsample_ms']:7.2f} ms ({baseline['scan_nonsample_ms']/baseline['total_ms']*100:5.1f}%)")
+
+    print(f"\n{'Threads':<8} {'BuildFurthest':<17} {'SampleIntervals':<17} {'BuildConnections':<17} {'ScanSamples':<15} {'ScanNonsample':<15} {'Total':<10}")
+    print("-" * 105)
+
+    # Speedup of every phase (plus total) for every thread count, relative to 1 thread
+    phases = np.stack([breakdown_data[key] for key in PHASE_KEYS + ['total_ms']], axis=1)
+    speedups = phases[0] / phases
+    col_widths = [17, 17, 17, 15, 15, 0]
+
+    print("\n".join(f"{t:<8} " + "".join(f"{v:>6.2f}x".ljust(w) for v, w in zip(row, col_widths))
+                    for t, row in zip(breakdown_data['threads'], speedups)))
+
+    print("\n" + "="*70)
+    print("KEY FINDINGS:")
+    print("="*70)
+
+    # Find best configuration
+    best = max(breakdown_data, key=lambda x: baseline['total_ms'] / x['total_ms'])
+    print(f"\n1. Best Configuration: {best['threads']} threads")
+    print(f"   - Total speedup: {baseline['total_ms'] / best['total_ms']:.2f}x")
+    print(f"   - Time: {best['total_ms']:.2f} ms (down from {baseline['total_ms']:.2f} ms)")
+
+    # Identify bottleneck
+    bottleneck_phase = max(['build_furthest', 'sample_intervals', 'build_connections', 'scan_samples', 'scan_nonsample'],
+                           key=lambda phase: baseline[f'{phase}_ms'])
+    print(f"\n2. Primary Bottleneck: {bottleneck_phase.replace('_', ' ').title()}")
+    print(f"   - Takes {baseline[f'{bottleneck_phase}_ms']/baseline['total_ms']*100:.1f}% of total time (1 thread)")
+    print(f"   - Takes {best[f'{bottleneck_phase}_ms']/best['total_ms']*100:.1f}% of total time ({best['threads']} threads)")
+
+    # Analyze scaling
+    print(f"\n3. Phase Scaling Analysis (1 → {best['threads']} threads):")
+    for phase_name, phase_key in [('BuildFurthest', 'build_furthest_ms'),
+                                   ('SampleIntervals', 'sample_intervals_ms'),
+                                   ('BuildConnections', 'build_connections_ms'),
+                                   ('ScanSamples', 'scan_samples_ms'),
+                                   ('ScanNonsample', 'scan_nonsample_ms')]:
+        speedup = baseline[phase_key] / best[phase_key]
+        efficiency = (speedup / best['threads']) * 100
+        print(f"   - {phase_name:<17}: {speedup:5.2f}x speedup ({efficiency:5.1f}% efficiency)")
+
+    print("\n" + "="*70)
+    print("All breakdown graphs generated successfully in ./plots/")
+    print("="*70)
+
+
+def render_scaling(sdata, fig, ax):
+    sizes = sdata.get_unique('n')
+    thread_counts = sdata.get_unique('threads', algorithm='parallel')
+
+    print("Generating performance visualizations...")
+    print(f"Input sizes: {sizes}")
+    print(f"Thread counts: {thread_counts}\n")
+
+    # Per-size serial baselines and per-thread parallel means, computed once and
+    # shared by Graphs 2-4 and the summary
+    per_size = {}
+    for size in sizes:
+        serial = sdata.get_data(algorithm='serial', n=size)
+        par_time = {}
+        par_tp = {}
+        for threads in thread_counts:
+            par_data = sdata.get_data(algorithm='parallel', n=size, threads=threads)
+            if par_data.size:
+                par_time[threads] = np.mean(par_data['time_ms'])
+                par_tp[threads] = np.mean(par_data['throughput_M_per_sec'])
+        per_size[size] = {'serial_time': np.mean(serial['time_ms']),
+                          'serial_tp': np.mean(serial['throughput_M_per_sec']),
+                          'par_time': par_time,
+                          'par_tp': par_tp}
+
+    colors_threads = list(plt.cm.viridis(np.linspace(0, 0.9, len(thread_counts))))
+    colors_sizes = list(plt.cm.plasma(np.linspace(0, 0.9, len(sizes))))
+
+    # ============================================================================
+    # Graph 1: Execution Time vs Input Size
+    # ============================================================================
+    print("Graph 1: Execution Time vs Input Size...")
+
+    ax.clear()
+
+    # Serial
+    serial = sdata.get_data(algorithm='serial')
+    ax.loglog(serial['n'], serial['time_ms'], 'k-', linewidth=3, marker='o',
+              markersize=8, label='Serial', zorder=10)
+
+    # Parallel
+    for threads, color in zip(thread_counts, colors_threads):
+        par_data = np.sort(sdata.get_data(algorithm='parallel', threads=threads), order='n')
+        if par_data.size:
+            ns = par_data['n']
+            times = par_data['time_ms']
+            ax.loglog(ns, times, marker='s', markersize=6, color=color,
+                      label=f'Parallel-{threads}-threads')
+
+    ax.set_xlabel('Input Size (intervals)', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Time (ms, log scale)', fontsize=12, fontweight='bold')
+    ax.set_title('Execution Time vs Input Size', fontsize=14, fontweight='bold')
+    ax.legend(loc='upper left')
+    ax.grid(True, which='both', alpha=0.3)
+    save_both(fig, 'time_vs_size')
+
+    # ============================================================================
+    # Graph 2: Speedup vs Thread Count
+    # ============================================================================
+    print("Graph 2: Speedup vs Thread Count...")
+
+    ax.clear()
+
+    for size, color in zip(sizes, colors_sizes):
+        stats = per_size[size]
+        threads_list = list(stats['par_time'])
+        speedups = [stats['serial_time'] / time_ms for time_ms in stats['par_time'].values()]
+        if speedups:
+            ax.plot(threads_list, speedups, marker='o', markersize=8,
+                    color=color, label=f'n={size:,}', linewidth=2)
+
+    ax.axhline(y=1.0, color='red', linestyle='--', linewidth=2,
+               label='Serial Baseline', zorder=5)
+    max_threads = max(thread_counts)
+    ax.plot([1, max_threads], [1, max_threads], 'k:', linewidth=2,
+            alpha=0.5, label='Ideal Linear')
+
+    ax.set_xlabel('Threads', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Speedup (vs Serial)', fontsize=12, fontweight='bold')
+    ax.set_title('Speedup vs Thread Count (Strong Scaling)', fontsize=14, fontweight='bold')
+    ax.legend(loc='upper left', ncol=2)
+    ax.grid(True, alpha=0.3)
+    ax.set_xticks(thread_counts)
+    save_both(fig, 'speedup_vs_threads')
+
+    # ============================================================================
+    # Graph 3: Throughput vs Thread Count
+    # ============================================================================
+    print("Graph 3: Throughput vs Thread Count...")
+
+    ax.clear()
+
+    for size, color in zip(sizes, colors_sizes):
+        stats = per_size[size]
+        threads_list = list(stats['par_tp'])
+        throughputs = list(stats['par_tp'].values())
+        if throughputs:
+            ax.plot(threads_list, throughputs, marker='s', markersize=8,
+                    color=color, label=f'Parallel n={size:,}', linewidth=2)
+        ax.axhline(y=stats['serial_tp'], color=color, linestyle='--',
+                   linewidth=1.5, alpha=0.6)
+
+    ax.set_xlabel('Threads', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Throughput (M intervals/sec)', fontsize=12, fontweight='bold')
+    ax.set_title('Throughput vs Thread Count\n(Dashed: Serial Baseline)', fontsize=14, fontweight='bold')
+    ax.legend(loc='upper left', ncol=2)
+    ax.grid(True, alpha=0.3)
+    ax.set_xticks(thread_counts)
+    save_both(fig, 'throughput_vs_threads')
+
+    # ============================================================================
+    # Graph 4: Parallel Efficiency vs Thread Count
+    # ============================================================================
+    print("Graph 4: Parallel Efficiency vs Thread Count...")
+
+    ax.clear()
+
+    for size, color in zip(sizes, colors_sizes):
+        par_time = per_size[size]['par_time']
+        if 1 not in par_time:
+            continue
+        baseline = par_time[1]
+
+        threads_list = list(par_time)
+        efficiencies = [(baseline / time_ms / threads) * 100.0 for threads, time_ms in par_time.items()]
+        if efficiencies:
+            ax.plot(threads_list, efficiencies, marker='o', markersize=8,
+                    color=color, label=f'n={size:,}', linewidth=2)
+
+    ax.axhline(y=100, color='green', linestyle='--', linewidth=2,
+               label='100% (Ideal)', zorder=5)
+    ax.set_xlabel('Threads', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Efficiency (%)', fontsize=12, fontweight='bold')
+    ax.set_title('Parallel Efficiency vs Thread Count', fontsize=14, fontweight='bold')
+    ax.legend(loc='upper right', ncol=2)
+    ax.grid(True, alpha=0.3)
+    ax.set_xticks(thread_counts)
+    ax.set_ylim([0, 110])
+    save_both(fig, 'efficiency_vs_threads')
+
+    # ============================================================================
+    # Summary
+    # ============================================================================
+    print("="*60)
+    print("PERFORMANCE SUMMARY")
+    print("="*60)
+
+    for size in sizes:
+        print(f"\nInput Size: {size:,} intervals")
+        print("-" * 60)
+        stats = per_size[size]
+        serial_time = stats['serial_time']
+        print(f"  Serial: {serial_time:.2f} ms ({stats['serial_tp']:.1f} M/s)")
+
+        for threads, par_time in stats['par_time'].items():
+            par_tp = stats['par_tp'][threads]
+            speedup = serial_time / par_time
+            if speedup < 1.0:
+                overhead = (par_time / serial_time - 1) * 100
+                print(f"  {threads:2d} threads: {par_time:7.2f} ms ({par_tp:.1f} M/s) - {overhead:+.0f}% slower")
+            else:
+                print(f"  {threads:2d} threads: {par_time:7.2f} ms ({par_tp:.1f} M/s) - {speedup:.2f}x speedup")
+
+    print("\n" + "="*60)
+    print("All graphs generated successfully in ./plots/")
+    print("="*60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate benchmark plots')
+    parser.add_argument('targets', nargs='*', metavar='{breakdown,scaling}',
+                        help='which benchmark results to plot (default: both)')
+    targets = parser.parse_args().targets or ['breakdown', 'scaling']
+    for target in targets:
+        if target not in ('breakdown', 'scaling'):
+            parser.error(f"invalid target: {target!r} (choose from 'breakdown', 'scaling')")
+
+    # Load every requested input up front so a missing CSV fails before any plotting
+    datasets = {}
+    if 'breakdown' in targets:
+        datasets['breakdown'] = Dataset(
+            load_csv(BREAKDOWN_FILE, BREAKDOWN_SCHEMA, 'tools/run_parallel_breakdown.sh'),
+            ('n', 'threads'))
+    if 'scaling' in targets:
+        datasets['scaling'] = Dataset(
+            load_csv(SCALING_FILE, SCALING_SCHEMA, 'tools/run_thread_scaling.sh'),
+            ('algorithm', 'n', 'threads'))
+
+    # Create plots directory
+    PLOTS_DIR.mkdir(exist_ok=True)
+
+    configure_rcparams()
+    fig, ax = create_figure()
+
+    if 'breakdown' in datasets:
+        render_breakdown(datasets['breakdown'], fig, ax)
+    if 'scaling' in datasets:
+        render_scaling(datasets['scaling'], fig, ax)
+
+    plt.close(fig)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,9 @@ echo "Running ALL Benchmarks"
 echo "========================================"
 echo ""
 
+# Plot both benchmarks in one Python process at the end
+export SKIP_PLOTS=1
+
 echo "### Parallel Breakdown Benchmark ###"
 "$SCRIPT_DIR/bench_parallel_breakdown.sh"
 
@@ -18,6 +21,13 @@ echo ""
 echo "### Thread Scaling Benchmark ###"
 "$SCRIPT_DIR/bench_thread_scaling.sh"
 
+echo ""
+echo "----------------------------------------"
+echo ""
+
+echo "### Generating Plots ###"
+python3 "$SCRIPT_DIR/plot_all.py"
+
 echo ""
 echo "========================================"
 echo "All benchmarks complete!"